@@ -0,0 +1,617 @@
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Optional
+import wx
+import wx.adv
+import ctypes
+from ctypes import wintypes
+import pyvda
+import win32gui
+import win32con
+
+
+# The user32 functions we call, declared once with their full prototypes so ctypes doesn't have
+# to look them up and guess argument conversions on every call
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+MonitorEnumProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HMONITOR, wintypes.HDC,
+                                     ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
+
+_EnumDisplayMonitors = _user32.EnumDisplayMonitors
+_EnumDisplayMonitors.argtypes = [wintypes.HDC, ctypes.POINTER(wintypes.RECT), MonitorEnumProc,
+                                 wintypes.LPARAM]
+_EnumDisplayMonitors.restype = wintypes.BOOL
+
+
+class Monitor:
+    """Represents a monitor with its position and size."""
+    # Filled on the first `get_all` call and dropped by `invalidate_cache` when the display
+    # configuration changes.
+    _cached: Optional[list[Monitor]] = None
+
+    def __init__(self, index: int, handle: int, left: int, top: int, width: int, height: int):
+        self.index = index
+        self.handle = handle
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+
+    @property
+    def right(self):
+        return self.left + self.width
+
+    @property
+    def bottom(self):
+        return self.top + self.height
+
+    @classmethod
+    def get_all(cls) -> list[Monitor]:
+        """Get all monitors in the system."""
+        if cls._cached is not None:
+            return cls._cached
+
+        monitors = []
+
+        def enum_monitors_callback(hmonitor, hdc, rect, data):
+            index = len(monitors)
+            monitor = Monitor(
+                index=index,
+                handle=hmonitor,
+                left=rect.contents.left,
+                top=rect.contents.top,
+                width=rect.contents.right - rect.contents.left,
+                height=rect.contents.bottom - rect.contents.top
+            )
+            monitors.append(monitor)
+            return True
+
+        callback = MonitorEnumProc(enum_monitors_callback)
+        _EnumDisplayMonitors(None, None, callback, 0)
+
+        cls._cached = monitors
+        return monitors
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget the cached monitors, so the next `get_all` call enumerates them again."""
+        cls._cached = None
+
+
+class DesktopNumberOverlay(wx.Frame):
+    """Single small overlay window showing desktop number."""
+    # Created on first use, because GDI objects can only be made after the `wx.App` exists
+    _font: Optional[wx.Font] = None
+    # Size of each desktop number's text in `_font`, measured once for all overlays
+    _text_extents: dict[int, tuple[int, int]] = {}
+
+    @classmethod
+    def get_font(cls) -> wx.Font:
+        """Get the large bold font used for the desktop number."""
+        if cls._font is None:
+            cls._font = wx.Font(72, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        return cls._font
+
+    @staticmethod
+    def get_text(desktop_number: int) -> str:
+        """Display "0" for desktop 10, otherwise show the desktop number."""
+        return '0' if desktop_number == 10 else str(desktop_number)
+
+    @classmethod
+    def get_text_extent(cls, desktop_number: int) -> tuple[int, int]:
+        """Get the width and height of a desktop number's text."""
+        if not cls._text_extents:
+            # Create a temporary DC to measure text size
+            temp_bmp = wx.Bitmap(1, 1)
+            temp_dc = wx.MemoryDC(temp_bmp)
+            temp_dc.SetFont(cls.get_font())
+            for number in range(1, 11):
+                cls._text_extents[number] = tuple(temp_dc.GetTextExtent(cls.get_text(number)))
+            temp_dc.SelectObject(wx.NullBitmap)
+        return cls._text_extents[desktop_number]
+
+    def __init__(self, x: int, y: int):
+        # `TRANSPARENT_WINDOW` makes the window click-through (`WS_EX_TRANSPARENT`) and
+        # `FRAME_TOOL_WINDOW` keeps it out of Alt+Tab (`WS_EX_TOOLWINDOW`). Both are set when the
+        # window is created, rather than patched into its extended style afterwards.
+        super().__init__(None, style=wx.FRAME_NO_TASKBAR | wx.FRAME_TOOL_WINDOW | wx.STAY_ON_TOP |
+                                     wx.NO_BORDER | wx.TRANSPARENT_WINDOW)
+
+        self.desktop_number: Optional[int] = None
+
+        # We paint every pixel ourselves, so don't let wx erase the background first
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+
+        # The window is reused for every desktop number, so size it to fit the widest one
+        text_extents = [self.get_text_extent(desktop_number) for desktop_number in range(1, 11)]
+        text_width = max(width for width, height in text_extents)
+        text_height = max(height for width, height in text_extents)
+
+        # Add margin around the text (20px on each side)
+        margin = 20
+        window_width = text_width + margin * 2
+        window_height = text_height + margin * 2
+
+        # Position and size the window
+        self.SetSize((window_width, window_height))
+        self.SetPosition((x, y))
+
+        self._cached_bmp = wx.Bitmap(window_width, window_height)
+        self._rendered_desktop_number: Optional[int] = None
+
+        # Make window semi-transparent (70% opacity = 179 out of 255). On Windows this adds the
+        # `WS_EX_LAYERED` style and makes one `SetLayeredWindowAttributes(LWA_ALPHA)` call, with
+        # no extra buffering on wx's side, so there's nothing to gain by calling user32 directly.
+        self.SetTransparent(179)
+
+        # Setup drawing
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+
+    def set_desktop_number(self, desktop_number: int) -> None:
+        """Show a new desktop number in the overlay.
+
+        The bitmap is only rendered on the next paint, so switching desktops several times in a
+        row between two paints renders it just once.
+        """
+        if desktop_number == self.desktop_number:
+            return
+        self.desktop_number = desktop_number
+        self.Refresh(eraseBackground=False)
+
+    def _render(self) -> None:
+        """Render the current desktop number into the bitmap that `on_paint` blits."""
+        width, height = self._cached_bmp.GetSize()
+        dc = wx.MemoryDC(self._cached_bmp)
+
+        # Draw black background
+        dc.SetBrush(wx.BLACK_BRUSH)
+        dc.SetPen(wx.TRANSPARENT_PEN)
+        dc.DrawRectangle(0, 0, width, height)
+
+        # Draw white text, centered
+        dc.SetFont(self.get_font())
+        dc.SetTextForeground(wx.WHITE)
+        text_width, text_height = self.get_text_extent(self.desktop_number)
+        dc.DrawText(self.get_text(self.desktop_number),
+                    (width - text_width) // 2, (height - text_height) // 2)
+        dc.SelectObject(wx.NullBitmap)
+
+        self._rendered_desktop_number = self.desktop_number
+
+    def on_paint(self, event):
+        """Blit the pre-rendered desktop number."""
+        if self._rendered_desktop_number != self.desktop_number:
+            self._render()
+        dc = wx.PaintDC(self)
+        dc.DrawBitmap(self._cached_bmp, 0, 0)
+
+
+class DesktopNumberOverlayManager:
+    """Manages overlay windows (one per monitor) and hides them shortly after being shown.
+
+    The overlays are created on the first `show` call and then reused for every desktop switch,
+    until `reset` is called because the monitors changed. A single timer hides them, and is
+    restarted on every `show`. Owned by `DodoFrame`, since it needs a `wx.App` to exist.
+    """
+    def __init__(self) -> None:
+        self.overlays: list[DesktopNumberOverlay] = []
+
+        # Setup timer to hide all overlays after they've been shown
+        self.timer = wx.Timer()
+        self.timer.Bind(wx.EVT_TIMER, self.on_timer)
+
+    def _create_overlays(self) -> None:
+        # Create one overlay per monitor
+        for monitor in Monitor.get_all():
+            # Position at top-left of each monitor with 20px padding
+            overlay = DesktopNumberOverlay(monitor.left + 20, monitor.top + 20)
+            self.overlays.append(overlay)
+
+    def show(self, desktop_number: int) -> None:
+        """Show the desktop number on all monitors for 1.5 seconds."""
+        if not self.overlays:
+            self._create_overlays()
+
+        for overlay in self.overlays:
+            overlay.set_desktop_number(desktop_number)
+            # Don't take focus away from the window the user is working in
+            overlay.ShowWithoutActivating()
+
+        # Restarting the timer keeps the overlays up while switches keep coming
+        if self.overlays:
+            self.timer.Start(1500, wx.TIMER_ONE_SHOT)
+
+    def on_timer(self, event):
+        """Hide all overlays when timer expires."""
+        for overlay in self.overlays:
+            overlay.Hide()
+
+    def reset(self) -> None:
+        """Destroy the overlays, so the next `show` call creates them for the current monitors.
+
+        Safe to call from any event handler: wx defers the actual deletion of top-level windows
+        until the event loop is idle.
+        """
+        self.timer.Stop()
+        for overlay in self.overlays:
+            overlay.Destroy()
+        self.overlays.clear()
+
+class VirtualDesktopAccessor:
+    """Access Windows Virtual Desktop functionality using pyvda library"""
+
+    def __init__(self, frame: Optional[DodoFrame] = None) -> None:
+        self.current_desktop_number: Optional[int] = None
+        self.previous_desktop_number: Optional[int] = None
+        self.frame = frame
+        # Desktop GUID to number, as last seen. Only a hint; see `get_current_desktop_number`.
+        self._desktop_numbers: dict[Any, int] = {}
+
+        try:
+            # Test if pyvda is working
+            current = pyvda.VirtualDesktop.current()
+            self.current_desktop_number = current.number
+            print(f'Virtual Desktop Manager initialized (current desktop: {current.number})')
+
+            # Ensure we have 10 desktops
+            self.ensure_ten_desktops()
+            self.load_desktop_numbers()
+
+        except Exception as e:
+            print(f'Failed to initialize Virtual Desktop Manager: {e}')
+            print('Note: This requires Windows 10/11 with virtual desktops enabled')
+
+    def ensure_ten_desktops(self) -> None:
+        """Ensure there are at least 10 virtual desktops"""
+        try:
+            desktops = pyvda.get_virtual_desktops()
+            current_count = len(desktops)
+
+            if current_count < 10:
+                print(f'Creating {10 - current_count} additional desktops '
+                      f'(currently have {current_count})')
+                for _ in range(10 - current_count):
+                    pyvda.VirtualDesktop.create()
+                print('Now have 10 virtual desktops')
+            else:
+                print(f'Already have {current_count} virtual desktops')
+
+        except Exception as e:
+            print(f'Error ensuring 10 desktops: {e}')
+
+    def load_desktop_numbers(self) -> None:
+        """Record the number of every desktop by its ID."""
+        self._desktop_numbers = {desktop.id: number for number, desktop
+                                 in enumerate(pyvda.get_virtual_desktops(), 1)}
+
+    def get_current_desktop_number(self) -> int:
+        """Get the number of the active desktop.
+
+        The active desktop is always asked from Windows, because the user may have switched
+        desktops without Dodo (e.g. with Task View), and pyvda has no change notifications that
+        would let us keep track of that ourselves. Its number is taken from the last known
+        numbers and checked with a single lookup in the live desktop list, rather than found with
+        `VirtualDesktop.number`, which makes a COM call for every desktop. If the check fails
+        because desktops were added, removed or reordered, the numbers are loaded again.
+        """
+        current_id = pyvda.VirtualDesktop.current().id
+        number = self._desktop_numbers.get(current_id)
+        if number is not None:
+            try:
+                if pyvda.VirtualDesktop(number).id == current_id:
+                    return number
+            except ValueError:
+                # There are fewer than `number` desktops now
+                pass
+        self.load_desktop_numbers()
+        return self._desktop_numbers[current_id]
+
+    def switch_desktop_by_number(self, desktop_number: int) -> None:
+        """Switch to desktop by number (1-10)"""
+        if desktop_number < 1 or desktop_number > 10:
+            print(f'Invalid desktop number: {desktop_number}')
+            return
+
+        try:
+            # Not trusting `current_desktop_number`, see `get_current_desktop_number` for why
+            self.current_desktop_number = self.get_current_desktop_number()
+
+            if self.current_desktop_number == desktop_number:
+                print(f'Already on desktop {desktop_number}')
+                return
+
+            # pyvda uses 1-based indexing for VirtualDesktop constructor
+            desktop = pyvda.VirtualDesktop(desktop_number)
+            desktop.go()
+
+            self.previous_desktop_number = self.current_desktop_number
+            self.current_desktop_number = desktop_number
+
+            # Show desktop number overlay. We're called from hotkey and menu handlers, which
+            # already run on the UI thread, so there's no need to go through `wx.CallAfter`.
+            if self.frame:
+                self._show_desktop_overlay(desktop_number)
+
+        except Exception as e:
+            print(f'Error switching to desktop {desktop_number}: {e}')
+
+    def _show_desktop_overlay(self, desktop_number: int) -> None:
+        """Show the desktop number overlay. Must be called on the UI thread."""
+        try:
+            self.frame.overlay_manager.show(desktop_number)
+        except Exception as e:
+            print(f'Error showing desktop overlay: {e}')
+
+    def switch_to_previous_desktop(self) -> None:
+        """Switch back to the previously active desktop"""
+        if self.previous_desktop_number is None:
+            print('No previous desktop recorded')
+            return
+
+        target = self.previous_desktop_number
+        self.switch_desktop_by_number(target)
+
+    def move_window_to_desktop(self, desktop_number: int) -> None:
+        """Move the active window to a specific desktop"""
+        if desktop_number < 1 or desktop_number > 10:
+            print(f'Invalid desktop number: {desktop_number}')
+            return
+
+        try:
+            # Get the active window handle
+            hwnd = win32gui.GetForegroundWindow()
+            if not hwnd:
+                print('No active window found')
+                return
+
+            window_title = win32gui.GetWindowText(hwnd)
+            print(f'Moving window: {window_title}')
+
+            # Create AppView for the current window
+            app_view = pyvda.AppView(hwnd)
+
+            # Get the target desktop (pyvda uses 1-based indexing)
+            target_desktop = pyvda.VirtualDesktop(desktop_number)
+
+            # Move window to desktop
+            app_view.move(target_desktop)
+            print(f'Moved window to desktop {desktop_number}')
+
+        except Exception as e:
+            print(f'Error moving window to desktop {desktop_number}: {e}')
+
+    def pin_window(self) -> None:
+        """Pin the active window to all desktops"""
+        try:
+            # Get the active window handle
+            hwnd = win32gui.GetForegroundWindow()
+            if not hwnd:
+                print('No active window found')
+                return
+
+            window_title = win32gui.GetWindowText(hwnd)
+
+            # Create AppView for the current window
+            app_view = pyvda.AppView(hwnd)
+
+            # Pin the window (only if not already pinned)
+            if not app_view.is_pinned():
+                app_view.pin()
+                print(f'Pinned window to all desktops: {window_title}')
+            else:
+                print(f'Window already pinned: {window_title}')
+
+        except Exception as e:
+            print(f'Error pinning window: {e}')
+
+class Dodo:
+    def __init__(self, frame: Optional[DodoFrame] = None) -> None:
+        print('Starting Dodo Desktop Switcher')
+        self.vda = VirtualDesktopAccessor(frame)
+
+    def cleanup(self) -> None:
+        """Cleanup."""
+        print('Dodo shutting down')
+
+class DodoTaskBarIcon(wx.adv.TaskBarIcon):
+    def __init__(self, frame: DodoFrame) -> None:
+        super(DodoTaskBarIcon, self).__init__()
+        self.frame = frame
+
+        # Create a custom icon with 'DD' in blue color
+        icon_size = 16
+        bmp = wx.Bitmap(icon_size, icon_size)
+        dc = wx.MemoryDC(bmp)
+
+        # Set white background
+        dc.SetBackground(wx.WHITE_BRUSH)
+        dc.Clear()
+
+        # Draw 'DD' in blue color
+        blue_color = wx.Colour(0, 100, 200)
+        dc.SetTextForeground(blue_color)
+        dc.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
+                           wx.FONTWEIGHT_BOLD))
+
+        # Draw text centered
+        text = 'DD'
+        text_width, text_height = dc.GetTextExtent(text)
+        x = (icon_size - text_width) // 2
+        y = (icon_size - text_height) // 2
+        dc.DrawText(text, x, y)
+
+        dc.SelectObject(wx.NullBitmap)
+
+        # Create icon from bitmap
+        icon = wx.Icon()
+        icon.CopyFromBitmap(bmp)
+
+        self.SetIcon(icon, 'Dodo Desktop Switcher')
+        self.menu = self._build_menu()
+        self.Bind(wx.adv.EVT_TASKBAR_LEFT_DOWN, self.on_left_down)
+
+    def on_left_down(self, event: wx.Event) -> None:
+        self.PopupMenu(self.menu)
+
+    def GetPopupMenu(self) -> wx.Menu:
+        # Unlike a menu returned from `CreatePopupMenu`, wx doesn't delete this one after showing
+        # it, so we can build it just once.
+        return self.menu
+
+    def _build_menu(self) -> wx.Menu:
+        menu = wx.Menu()
+
+        # Add desktop switching options. They get contiguous IDs, so a single handler can tell the
+        # desktop number from the ID.
+        desktops_menu = wx.Menu()
+        self._desktop_menu_base_id = wx.Window.NewControlId(10)
+        for i in range(1, 11):
+            # Desktop 10 is on Alt+0
+            desktops_menu.Append(self._desktop_menu_base_id + i - 1, f'Desktop {i} (Alt+{i % 10})')
+        self.Bind(wx.EVT_MENU_RANGE, self.on_desktop_menu, id=self._desktop_menu_base_id,
+                  id2=self._desktop_menu_base_id + 9)
+
+        menu.AppendSubMenu(desktops_menu, 'Switch to Desktop')
+        menu.AppendSeparator()
+
+        about_item = menu.Append(wx.ID_ANY, 'About')
+        exit_item = menu.Append(wx.ID_EXIT, 'Exit')
+
+        self.Bind(wx.EVT_MENU, self.on_about, about_item)
+        self.Bind(wx.EVT_MENU, self.on_exit, exit_item)
+
+        return menu
+
+    def on_desktop_menu(self, event: wx.Event) -> None:
+        desktop_number = event.GetId() - self._desktop_menu_base_id + 1
+        self.frame.dodo.vda.switch_desktop_by_number(desktop_number)
+
+    def on_about(self, event: wx.Event) -> None:
+        wx.MessageBox(
+            'Dodo Desktop Switcher\n\n'
+            'Keyboard shortcuts:\n'
+            'Alt+1 to Alt+9: Switch to desktop 1-9\n'
+            'Alt+0: Switch to desktop 10\n'
+            'Alt+-: Switch to the previously active desktop\n'
+            'Alt+Shift+1 to Alt+Shift+9: Move window to desktop 1-9\n'
+            'Alt+Shift+0: Move window to desktop 10\n'
+            'Alt+Shift+`: Pin window to all desktops\n\n'
+            'Note: Requires Windows 10/11 with virtual desktops enabled',
+            'About Dodo', wx.OK | wx.ICON_INFORMATION)
+
+    def on_exit(self, event: wx.Event) -> None:
+        wx.CallAfter(self.Destroy)
+        self.frame.Close()
+
+
+class DodoFrame(wx.Frame):
+    # Hotkeys get consecutive IDs starting here, so an ID minus this is an index into
+    # `hotkey_handlers`
+    FIRST_HOTKEY_ID = 100
+
+    def __init__(self) -> None:
+        super(DodoFrame, self).__init__(None, title='Dodo Desktop Switcher', size=(1, 1))
+        self.tbicon = DodoTaskBarIcon(self)
+        self.overlay_manager = DesktopNumberOverlayManager()
+        self.dodo = Dodo(self)
+        self.hotkey_ids: list[int] = []
+        # One handler per hotkey ID, or `None` if that hotkey couldn't be registered
+        self.hotkey_handlers: list[Optional[Callable[[], None]]] = []
+
+        # Hide the frame
+        self.Show(False)
+
+        # Register hotkeys
+        self.register_hotkeys()
+        print('Use the system tray icon to switch desktops')
+
+        # Bind the close event
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+        # Re-enumerate monitors after they're added, removed or rearranged
+        self.Bind(wx.EVT_DISPLAY_CHANGED, self.on_display_changed)
+
+    def _register_hotkey(self, modifiers: int, key_code: int,
+                         handler: Callable[[], None]) -> bool:
+        """Register a hotkey under the next free ID, and remember its handler."""
+        hotkey_id = self.FIRST_HOTKEY_ID + len(self.hotkey_handlers)
+        if self.RegisterHotKey(hotkey_id, modifiers, key_code):
+            self.hotkey_handlers.append(handler)
+            self.hotkey_ids.append(hotkey_id)
+            return True
+        else:
+            self.hotkey_handlers.append(None)
+            return False
+
+    def register_hotkeys(self) -> None:
+        """Register system-wide hotkeys using wx"""
+        vda = self.dodo.vda
+        try:
+            # Register Alt+1 through Alt+9 for desktops 1-9
+            for i in range(1, 10):
+                if self._register_hotkey(win32con.MOD_ALT, ord(str(i)),
+                                         functools.partial(vda.switch_desktop_by_number, i)):
+                    print(f'Registered Alt+{i} for desktop {i}')
+
+            # Register Alt+0 for desktop 10
+            if self._register_hotkey(win32con.MOD_ALT, ord('0'),
+                                     functools.partial(vda.switch_desktop_by_number, 10)):
+                print(f'Registered Alt+0 for desktop 10')
+
+            # Register Alt+- for returning to the previous desktop
+            if self._register_hotkey(win32con.MOD_ALT, wx.WXK_F17,
+                                     vda.switch_to_previous_desktop):
+                print('Registered Alt+F17 for previous desktop (AHK should funnel Alt+- to this)')
+
+            # Register Alt+Shift+1 through Alt+Shift+9 for moving windows
+            for i in range(1, 10):
+                if self._register_hotkey(win32con.MOD_ALT | win32con.MOD_SHIFT, ord(str(i)),
+                                         functools.partial(vda.move_window_to_desktop, i)):
+                    print(f'Registered Alt+Shift+{i} for moving window to desktop {i}')
+
+            # Register Alt+Shift+0 for moving window to desktop 10
+            if self._register_hotkey(win32con.MOD_ALT | win32con.MOD_SHIFT, ord('0'),
+                                     functools.partial(vda.move_window_to_desktop, 10)):
+                print(f'Registered Alt+Shift+0 for moving window to desktop 10')
+
+            # Register Alt+Shift+` for pinning/unpinning window
+            # The tilde key (~) is VK code 192 (the key to the left of 1)
+            if self._register_hotkey(win32con.MOD_ALT | win32con.MOD_SHIFT,
+                                     192,  # VK_OEM_3 (tilde/backtick key)
+                                     vda.pin_window):
+                print('Registered Alt+Shift+` for pinning window')
+
+            # Bind the hotkey event handler
+            self.Bind(wx.EVT_HOTKEY, self.on_hotkey)
+
+            if self.hotkey_ids:
+                print(f'Successfully registered {len(self.hotkey_ids)} hotkeys')
+            else:
+                print('Warning: No hotkeys were registered')
+
+        except Exception as e:
+            print(f'Error registering hotkeys: {e}')
+
+    def on_hotkey(self, event: wx.Event) -> None:
+        """Handle hotkey events"""
+        # We only get events for hotkeys we registered, so the slot always has a handler
+        self.hotkey_handlers[event.GetId() - self.FIRST_HOTKEY_ID]()
+
+    def on_display_changed(self, event: wx.Event) -> None:
+        Monitor.invalidate_cache()
+        self.overlay_manager.reset()
+        event.Skip()
+
+    def on_close(self, event: wx.Event) -> None:
+        # Unregister all hotkeys
+        for hotkey_id in self.hotkey_ids:
+            try:
+                self.UnregisterHotKey(hotkey_id)
+            except:
+                pass
+
+        # The hidden overlays are top-level windows too, and would keep the app alive
+        self.overlay_manager.reset()
+        self.dodo.cleanup()
+        self.Destroy()